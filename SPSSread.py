@@ -12,11 +12,11 @@ Notes: This only imports types 7 subtypes 3, 4, 5 and 6. Other subtypes are:
 8: Data Entry for Windows (DEW) information
 10: TextSmart information
 11: Measurement level, column width and alignment for each variable - DONE!
-13:
-14:
+13: Long variable names - DONE!
+14: Very long string variable widths - DONE!
 17: text field defining variable attributes
-20: Single string character encoding
-21: Encodes value labels for long string variables
+20: Single string character encoding - DONE!
+21: Encodes value labels for long string variables - DONE!
 
 USAGE:
 
@@ -27,10 +27,21 @@ args are:
 -all: to immediately import the file without waiting for commands to open
 and read it
 -pickle: to return the SPSS file pickled as a Python object (string format)
+-intern: to share one object between repeated values of a string variable
+-dictencode: as -intern, and also give each string variable 'categories' and
+'codes' attributes
 -help: to print this out
+
+keyword args are:
+
+sample=n: to read a random sample of n cases instead of all of them
+fraction=f: to read a random sample of about a fraction f of the cases
+seed=s: to seed the random sampling so it can be repeated
 """
 
 
+import codecs
+import random
 import struct
 import sys
 import pickle
@@ -58,13 +69,10 @@ def pkflt(vv):
 
 def pkstr(vv):
     """
-    An auxilliary function that returns a string from an 8-byte word. The 
-    string is NOT packed.
+    An auxilliary function that returns a string from a word of any length.
+    The string is NOT packed.
     """
-    bstr = ''
-    for i in str(vv):
-        bstr = bstr + struct.unpack("s",i)[0]
-    return bstr
+    return str(vv)
 
 
 class variable(object):
@@ -75,6 +83,7 @@ class variable(object):
     """
     def __init__(self):
         self.name = None # 8 char limit
+        self.longname = None
         self.namelabel = None
         self.data = []
         self.missingmarker = None
@@ -85,9 +94,10 @@ class variable(object):
         self.writeformatcode = []
         self.labelvalues = []
         self.labelfields = []
+        self.labels = {} # value -> label
 
 class SPSSFile(object):
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         self.filename = args[0]
         self.fin = None
         self.typecode = []
@@ -98,9 +108,24 @@ class SPSSFile(object):
         self.documents = ''
         self.variablelist = []
         self.rawvarlist = []
+        self.nameindex = {} # lower-case short and long name -> variable
         self.numvars = 0
         self.variablesets = None
         self.datevars = []
+        self.charcode = None
+        self.encoding = None
+        self.verylongstrings = {}
+        self.casesread = 0
+        self.sampleindex = None
+        self.sample = kwargs.get('sample')
+        self.fraction = kwargs.get('fraction')
+        self.seed = kwargs.get('seed')
+        if '-dictencode' in args:
+            self.stringmode = 'dictencode'
+        elif '-intern' in args:
+            self.stringmode = 'intern'
+        else:
+            self.stringmode = None
         if '-all' in args:
             self.OpenFile()
             self.GetRecords()
@@ -139,6 +164,7 @@ class SPSSFile(object):
             elif IN == 999:
                 # last record end
                 self.fin.read(4)
+                self.DecodeLabels()
                 self.GetData()
                 self.fin.close()
                 self.fin = None #need to remove file object for pickling
@@ -223,6 +249,8 @@ class SPSSFile(object):
                 x.missingd = tmpmiss
                 x.missingr = None
             if not nameblankflag:
+                x.longname = x.name.rstrip()
+                self.nameindex[x.longname.lower()] = x
                 self.variablelist.append(x)
                 self.rawvarlist.append(len(self.variablelist))
         elif x.typecode == -1:
@@ -248,13 +276,15 @@ class SPSSFile(object):
         fields = []
         for labels in range(IN):
             IN = self.fin.read(8)
-            IN = pkflt(IN)[0]
+            # kept raw until type 4 says whether these are numbers or strings
             values.append(IN)
             l = ord(self.fin.read(1))
-            if (l % 8) != 0:
-                l = l + 8 - (l % 8)
-            IN = pkstr(self.fin.read(l-1))
-            fields.append(IN)
+            # the length byte and label are padded to a multiple of 8
+            padded = l + 1
+            if (padded % 8) != 0:
+                padded = padded + 8 - (padded % 8)
+            IN = pkstr(self.fin.read(padded - 1))
+            fields.append(IN[:l])
         # get record type 4
         t = pkint(self.fin.read(4))[0]
         if t == 4:
@@ -265,10 +295,24 @@ class SPSSFile(object):
                 IN = pkint(self.fin.read(4))[0]
                 # this is index, store it
                 labelinds.append(IN)
+            variables = []
             for i in labelinds:
                 ind = self.rawvarlist[i-1]
-                self.variablelist[ind-1].labelvalues = values
-                self.variablelist[ind-1].labelfields = fields
+                variables.append(self.variablelist[ind-1])
+            stringlabels = False
+            for var in variables:
+                if var.typecode > 0:
+                    stringlabels = True
+            if stringlabels:
+                # decoded by DecodeLabels
+                values = [val.rstrip(' \x00') for val in values]
+            else:
+                values = [pkflt(val)[0] for val in values]
+            labels = dict(zip(values, fields))
+            for var in variables:
+                var.labelvalues = values
+                var.labelfields = fields
+                var.labels = labels
         else:
             print "Invalid subtype (%s)"%t
             return
@@ -303,6 +347,12 @@ class SPSSFile(object):
             self.GetType711()
         elif subtype == 13:
             self.GetType713()
+        elif subtype == 14:
+            self.GetType714()
+        elif subtype == 20:
+            self.GetType720()
+        elif subtype == 21:
+            self.GetType721()
         else:
             self.GetType7other()
 
@@ -326,7 +376,12 @@ class SPSSFile(object):
             self.FPrep = FPrep[pkint(self.fin.read(4))[0] - 1]
             self.compressionscheme = pkint(self.fin.read(4))[0]
             self.endiancode = endian[pkint(self.fin.read(4))[0] - 1]
-            self.charrepcode = charrep[pkint(self.fin.read(4))[0] - 1]
+            self.charcode = pkint(self.fin.read(4))[0]
+            try:
+                self.charrepcode = charrep[self.charcode - 1]
+            except IndexError:
+                # newer files store a code page number here
+                self.charrepcode = "Code page %s"%self.charcode
         else:
             print "Error reading type 7/3"
             return
@@ -403,21 +458,80 @@ class SPSSFile(object):
     def GetType713(self):
         """
         This method retrieves information about the long variable names 
-        record. 
+        record. This is a tab-separated list of SHORTNAME=LongName pairs; 
+        each long name is stored in the variable's 'longname' attribute and 
+        added to self.nameindex.
         """
         datatype = pkint(self.fin.read(4))[0]
         numelements = pkint(self.fin.read(4))[0]
-        IN = self.fin.read(numelements)
-        key = ''
-        value = ''
-        word = key
-        for byte in IN:
-            if ord(byte) == "=":
-                word = value
-            elif byte == '09':
-                word = key
-            else:
-                word = word + byte
+        IN = pkstr(self.fin.read(datatype * numelements))
+        for entry in IN.split('\t'):
+            if '=' in entry:
+                name, longname = entry.split('=', 1)
+                var = self.nameindex.get(name.rstrip().lower())
+                if var is not None:
+                    var.longname = longname
+                    self.nameindex[longname.lower()] = var
+
+    def GetType714(self):
+        """
+        This method retrieves the very long string record. This maps the
+        short name of each string variable wider than 255 bytes to its true
+        width. Such variables are stored as a run of 255-byte segments which
+        are joined again by StitchLongStrings once the data are read.
+        """
+        datatype = pkint(self.fin.read(4))[0]
+        numelements = pkint(self.fin.read(4))[0]
+        IN = pkstr(self.fin.read(datatype * numelements))
+        for entry in IN.split('\t'):
+            entry = entry.strip('\x00')
+            if '=' in entry:
+                name, width = entry.split('=', 1)
+                self.verylongstrings[name.rstrip()] = int(width)
+
+    def GetType720(self):
+        """
+        This method retrieves the character encoding record (eg, 'UTF-8' or
+        'windows-1252'). String data are decoded with this encoding.
+        """
+        datatype = pkint(self.fin.read(4))[0]
+        numelements = pkint(self.fin.read(4))[0]
+        IN = pkstr(self.fin.read(datatype * numelements))
+        self.encoding = IN.strip('\x00 ')
+
+    def GetType721(self):
+        """
+        This method retrieves the value labels of long string variables 
+        (wider than 8 bytes). These are stored in the same way as type 3 
+        labels: 'labelvalues', 'labelfields' and 'labels'. The values are 
+        stripped here and decoded by DecodeLabels, as the encoding record 
+        may come after this one.
+        """
+        datatype = pkint(self.fin.read(4))[0]
+        numelements = pkint(self.fin.read(4))[0]
+        IN = self.fin.read(datatype * numelements)
+        pos = 0
+        while pos < len(IN):
+            length = pkint(IN[pos:pos + 4])[0]
+            name = pkstr(IN[pos + 4:pos + 4 + length])
+            pos = pos + 4 + length
+            width = pkint(IN[pos:pos + 4])[0]
+            numlabels = pkint(IN[pos + 4:pos + 8])[0]
+            pos = pos + 8
+            values = []
+            fields = []
+            for i in range(numlabels):
+                length = pkint(IN[pos:pos + 4])[0]
+                values.append(IN[pos + 4:pos + 4 + length].rstrip(' \x00'))
+                pos = pos + 4 + length
+                length = pkint(IN[pos:pos + 4])[0]
+                fields.append(pkstr(IN[pos + 4:pos + 4 + length]))
+                pos = pos + 4 + length
+            var = self.GetVariable(name)
+            if var is not None:
+                var.labelvalues = values
+                var.labelfields = fields
+                var.labels = dict(zip(values, fields))
 
     def GetType7other(self):
         """
@@ -431,24 +545,135 @@ class SPSSFile(object):
 
     def GetData(self):
         """
-        This method retrieves the actual data and stores them into the 
-        appropriate variable's 'data' attribute.
+        This method retrieves the actual data and stores them into the
+        appropriate variable's 'data' attribute. String variables are read
+        as raw bytes and decoded a column at a time at the end. If the case 
+        count is known the data lists are allocated up front; if it is 
+        unknown (-1) cases are read until the end of the file. If a sample 
+        or fraction was asked for, only a random sample of cases is kept 
+        (see GetSample).
         """
         self.cluster = []
-        for case in range(self.numcases[0]):
-            for i, var in enumerate(self.variablelist):
-                if var.typecode == 0: # numeric variable
-                    N = self.GetNumber()
-                    if N == "False":
-                        print "Error returning case %s, var %s"%(case, i)
-                        sys.exit(1)
-                    var.data.append(N)
-                elif (var.typecode > 0) and (var.typecode < 256):
-                    S = self.GetString(var)
-                    if S == "False":
-                        print "Error returning case %s, var %s"%(case, i)
-                        sys.exit(1)
-                    var.data.append(S)
+        numcases = self.numcases[0]
+        if (self.sample is not None) or (self.fraction is not None):
+            self.GetSample()
+        elif numcases >= 0:
+            for var in self.variablelist:
+                var.data = [None] * numcases
+            case = 0
+            while case < numcases:
+                row = self.GetCase(case)
+                if row is None:
+                    break
+                for var, val in zip(self.variablelist, row):
+                    var.data[case] = val
+                case = case + 1
+            if case < numcases:
+                # fewer cases in the file than the header says
+                for var in self.variablelist:
+                    del var.data[case:]
+            self.casesread = case
+        else:
+            case = 0
+            while 1:
+                row = self.GetCase(case)
+                if row is None:
+                    break
+                for var, val in zip(self.variablelist, row):
+                    var.data.append(val)
+                case = case + 1
+            self.casesread = case
+        self.StitchLongStrings()
+        self.DecodeStrings()
+
+    def GetCase(self, case):
+        """
+        This method reads one case and returns its values as a list in the 
+        order of self.variablelist. None is returned if the data end before 
+        the case is complete, so the cases already read are kept.
+        """
+        row = []
+        for i, var in enumerate(self.variablelist):
+            if var.typecode == 0: # numeric variable
+                N = self.GetNumber()
+            else:
+                N = self.GetString(var)
+            if N == "False":
+                if i > 0:
+                    print "Data end partway through case %s, var %s"%(case, i)
+                return None
+            row.append(N)
+        return row
+
+    def GetSample(self):
+        """
+        This method reads a random sample of cases. With 'sample' (or 
+        'fraction' when the case count is known) a fixed number of cases is 
+        drawn: uncompressed files seek straight to the chosen cases, while 
+        compressed files are read through once keeping a reservoir of cases. 
+        With 'fraction' and an unknown case count, each case is kept with 
+        that probability. Cases are kept in file order, and their numbers 
+        are stored in self.sampleindex.
+        """
+        rng = random.Random(self.seed)
+        numcases = self.numcases[0]
+        seekable = (numcases >= 0) and (self.compressionswitch[0] == 0)
+        if seekable:
+            casesize = 0
+            for var in self.variablelist:
+                casesize = casesize + max(1, (var.typecode + 7) / 8) * 8
+            start = self.fin.tell()
+            # the header may claim more cases than the file holds
+            self.fin.seek(0, 2)
+            numcases = min(numcases, (self.fin.tell() - start) / casesize)
+        if self.sample is not None:
+            size = self.sample
+        elif numcases >= 0:
+            size = int(round(self.fraction * numcases))
+        else:
+            size = None
+        rows = []
+        indices = []
+        if seekable:
+            for case in sorted(rng.sample(xrange(numcases), min(size, numcases))):
+                self.fin.seek(start + case * casesize)
+                row = self.GetCase(case)
+                if row is None:
+                    break
+                rows.append(row)
+                indices.append(case)
+        elif size is not None:
+            case = 0
+            while (numcases < 0) or (case < numcases):
+                row = self.GetCase(case)
+                if row is None:
+                    break
+                if len(rows) < size:
+                    rows.append(row)
+                    indices.append(case)
+                else:
+                    ind = rng.randint(0, case)
+                    if ind < size:
+                        rows[ind] = row
+                        indices[ind] = case
+                case = case + 1
+            order = sorted(range(len(rows)), key=indices.__getitem__)
+            rows = [rows[ind] for ind in order]
+            indices = [indices[ind] for ind in order]
+        else:
+            case = 0
+            while 1:
+                row = self.GetCase(case)
+                if row is None:
+                    break
+                if rng.random() < self.fraction:
+                    rows.append(row)
+                    indices.append(case)
+                case = case + 1
+        for ind, var in enumerate(self.variablelist):
+            var.data = [row[ind] for row in rows]
+        self.sampleindex = indices
+        self.casesread = len(rows)
 
     def GetNumber(self):
         """
@@ -457,25 +682,28 @@ class SPSSFile(object):
         because of conflicts when 0 is returned) if the operation is not 
         possible.
         """
-        if self.compressionswitch == 0: # uncompressed number
+        if self.compressionswitch[0] == 0: # uncompressed number
             IN = self.fin.read(8)
-            if len(IN) < 1:
+            if len(IN) < 8:
                 return "False"
             else:
                 return pkflt(IN)[0]
         else: # compressed number
-            if len(self.cluster) == 0: # read new bytecodes
-                IN = self.fin.read(8)
-                for byte in IN:
-                    self.cluster.append(ord(byte))
-            byte = self.cluster.pop(0)
-            if (byte > 1) and (byte < 252):
+            byte = 0
+            while byte == 0: # 0 is padding
+                if len(self.cluster) == 0: # read new bytecodes
+                    IN = self.fin.read(8)
+                    if len(IN) < 8:
+                        return "False"
+                    self.cluster.extend(bytearray(IN))
+                byte = self.cluster.pop(0)
+            if (byte > 0) and (byte < 252):
                 return byte - 100
             elif byte == 252:
                 return "False"
             elif byte == 253:
                 IN = self.fin.read(8)
-                if len(IN) < 1:
+                if len(IN) < 8:
                     return "False"
                 else:
                     return pkflt(IN)[0]
@@ -486,41 +714,153 @@ class SPSSFile(object):
 
     def GetString(self, var):
         """
-        This method is called when a string is to be retrieved. Strings can be 
-        longer than 8-bytes long if so indicated. This method returns SYSMIS 
-        (the string not the Boolean) is returned due to conflicts. 
+        This method is called when a string is to be retrieved. A string of 
+        width w takes up (w + 7) / 8 8-byte blocks, which are all read here. 
+        The raw bytes are returned undecoded as whole columns are decoded 
+        later by DecodeStrings. This method returns "False" (the string, not 
+        the Boolean) if the data run out.
         """
-        if self.compressionswitch == 0:
-            IN = self.fin.read(8)
-            if len(IN) < 1:
-                return self.SYSMIS
+        numblocks = (var.typecode + 7) / 8
+        if self.compressionswitch[0] == 0:
+            IN = self.fin.read(8 * numblocks)
+            if len(IN) < 8 * numblocks:
+                return "False"
             else:
-                return pkstr(IN)
+                return IN
         else:
-            ln = ''
-            while 1:
+            blocks = []
+            while len(blocks) < numblocks:
                 if len(self.cluster) == 0:
                     IN = self.fin.read(8)
-                    for byte in IN:
-                        self.cluster.append(ord(byte))
+                    if len(IN) < 8:
+                        return "False"
+                    self.cluster.extend(bytearray(IN))
                 byte = self.cluster.pop(0)
-                if (byte > 0) and (byte < 252):
-                    return byte - 100
-                if byte == 252:
-                    return self.SYSMIS
-                if byte == 253:
+                if byte == 0:
+                    # padding, no block
+                    continue
+                elif byte == 252:
+                    return "False"
+                elif byte == 253:
                     IN = self.fin.read(8)
-                    if len(IN) < 1:
-                        return self.SYSMIS
-                    else:
-                        ln = ln + pkstr(IN)
-                        if len(ln) > var.typecode:
-                            return ln
-                if byte == 254:
-                    if ln != '':
-                        return ln
-                if byte == 255:
-                    return self.SYSMIS
+                    if len(IN) < 8:
+                        return "False"
+                    blocks.append(IN)
+                else:
+                    # 254 is an all-blank block
+                    blocks.append('        ')
+            return ''.join(blocks)
+
+    def StitchLongStrings(self):
+        """
+        This method joins the segments of very long string variables (type 7 
+        subtype 14) back into one variable each. Every segment but the last 
+        carries 252 bytes of the string. The segment variables that follow 
+        the first are then dropped from self.variablelist.
+        """
+        if not self.verylongstrings:
+            return
+        variables = []
+        ind = 0
+        while ind < len(self.variablelist):
+            var = self.variablelist[ind]
+            width = self.verylongstrings.get(var.name.rstrip())
+            if width is None:
+                variables.append(var)
+                ind = ind + 1
+                continue
+            numsegments = (width + 251) / 252
+            segments = self.variablelist[ind:ind + numsegments]
+            data = []
+            for parts in zip(*[segment.data for segment in segments]):
+                head = ''.join([part[:252] for part in parts[:-1]])
+                data.append((head + parts[-1])[:width])
+            var.data = data
+            var.typecode = width
+            variables.append(var)
+            ind = ind + numsegments
+        self.variablelist = variables
+        self.IndexNames()
+
+    def IndexNames(self):
+        """
+        This method rebuilds self.nameindex, which maps both the short and 
+        long name of each variable (in lower case, as SPSS names are not 
+        case sensitive) to the variable object.
+        """
+        self.nameindex = {}
+        for var in self.variablelist:
+            self.nameindex[var.name.rstrip().lower()] = var
+            self.nameindex[var.longname.lower()] = var
+
+    def DecodeLabels(self):
+        """
+        This method decodes the value labels of every variable, and the 
+        values too for string variables, with the encoding from GetEncoding. 
+        It is called once the whole dictionary has been read so that the 
+        values match the decoded data.
+        """
+        encoding = self.GetEncoding()
+        for var in self.variablelist:
+            if not var.labels:
+                continue
+            var.labelfields = [field.decode(encoding, 'replace')
+                               for field in var.labelfields]
+            if var.typecode > 0:
+                var.labelvalues = [val.decode(encoding, 'replace')
+                                   for val in var.labelvalues]
+            var.labels = dict(zip(var.labelvalues, var.labelfields))
+
+    def DecodeStrings(self):
+        """
+        This method decodes each string variable's data in a single call 
+        using the encoding from GetEncoding, and strips the blank padding. 
+        With '-intern', repeated values share one object. With '-dictencode' 
+        the variable also gets 'categories' (the distinct values in order of 
+        appearance) and 'codes' (the index into categories for each case).
+        """
+        encoding = self.GetEncoding()
+        for var in self.variablelist:
+            if var.typecode <= 0:
+                continue
+            raw = [val.rstrip(' \x00') for val in var.data]
+            try:
+                values = '\x00'.join(raw).decode(encoding).split(u'\x00')
+            except UnicodeDecodeError:
+                values = None
+            if (values is None) or (len(values) != len(raw)):
+                values = [val.decode(encoding, 'replace') for val in raw]
+            if self.stringmode is not None:
+                table = {}
+                values = [table.setdefault(val, val) for val in values]
+                if self.stringmode == 'dictencode':
+                    codes = {}
+                    var.codes = [codes.setdefault(val, len(codes)) for val in values]
+                    var.categories = sorted(codes, key=codes.get)
+            var.data = values
+
+    def GetEncoding(self):
+        """
+        This method returns the name of the codec for string data. The 
+        type 7 subtype 20 record is used if present, then the code page from 
+        type 7 subtype 3, and Latin-1 otherwise.
+        """
+        candidates = [self.encoding]
+        if self.charcode == 1:
+            candidates.append('cp500')
+        elif self.charcode == 2:
+            candidates.append('ascii')
+        elif self.charcode == 65001:
+            candidates.append('utf-8')
+        elif self.charcode > 4:
+            candidates.append('cp%s'%self.charcode)
+        for encoding in candidates:
+            if encoding:
+                try:
+                    return codecs.lookup(encoding).name
+                except LookupError:
+                    pass
+        return 'latin-1'
 
     def GetPrintWriteCode(self, code):
         """
@@ -617,6 +957,38 @@ class SPSSFile(object):
             names.append(variable.name)
         return names
 
+    def GetVariable(self, name):
+        """
+        This method returns the variable with the given short or long name, 
+        or None if there is no such variable. Names are matched regardless 
+        of case.
+        """
+        return self.nameindex.get(name.lower())
+
+    def GetColumns(self, names):
+        """
+        This method returns the data of the named variables (short or long 
+        names) as a list of columns. None is given for unknown names.
+        """
+        columns = []
+        for name in names:
+            var = self.GetVariable(name)
+            if var is None:
+                columns.append(None)
+            else:
+                columns.append(var.data)
+        return columns
+
+    def GetValueLabel(self, name, value):
+        """
+        This method returns the value label of a value of the named variable, 
+        or None if the variable or the label does not exist.
+        """
+        var = self.GetVariable(name)
+        if var is None:
+            return None
+        return var.labels.get(value)
+
     def GetLabels(self):
         """
         This method returns the labels of all the variables
@@ -639,13 +1011,13 @@ class SPSSFile(object):
         """
         This method returns a row of data
         """
-        if (row < 0) or (row > self.numcases):
+        if (row < 0) or (row >= self.casesread):
             return None
         else:
-            row = []
-            for ind, variable in enumerate(self.variablelist):
-                row.append(variable.data[ind])
-            return row
+            values = []
+            for variable in self.variablelist:
+                values.append(variable.data[row])
+            return values
 
 
 if __name__ == '__main__':
@@ -675,6 +1047,9 @@ if __name__ == '__main__':
     # FILE META-DATA:
     # x.eyecatcher # shows OS, machine, SPSS version etc
     # x.numOBSelements # puted number of variables (use x.numvars instead)
+    # x.numcases # number of cases in the header (-1 if unknown)
+    # x.casesread # number of cases actually read (or sampled)
+    # x.sampleindex # case numbers of a random sample (None if not sampled)
     # x.compressionswitch # 0 if not compressed
     # x.metastr # creation date, time, file label.
     # x.variablelist # list of variable objects contained within
@@ -685,12 +1060,14 @@ if __name__ == '__main__':
     # y = x.variablelist
     # y.data # the data
     # y.name # 8-byte variable name
+    # y.longname # long variable name (the short name if there is none)
     # y.label # longer string label
     # y.decplaces # number of decimal places
     # y.colwidth # column width
     # y.formattype # print format code (the exact data type)
     # y.labelvalues # values for substitute labels
     # y.labelfields # fields for substitute labels
+    # y.labels # dictionary of values to substitute labels
     # y.missingd # list of discrete missing values
     # y.missingr # upper and lower bounds of a range of missing values
     # and many more.
@@ -699,6 +1076,9 @@ if __name__ == '__main__':
     # EXTRAS:
 
     # * GetNames method to return names from all variables
+    # * GetVariable method to find a variable by its short or long name
+    # * GetColumns method to return data from named variables
+    # * GetValueLabel method to return the label of a variable's value
     # * GetRows method to return data from particular row
     # * GetLabels method to return labels from all variables
     # * GetTypeCodes method to return variables' typecodes